@@ -28,15 +28,18 @@ class BAMMetadataExtractor:
         metadata = {}
 
         try:
-            bamfile = pysam.AlignmentFile(self.filepath, "rb")
-
-            # Get the header as a dictionary
-            metadata["header"] = bamfile.header.to_dict()
-
-            # Get the name of the first read
-            first_read_name = next(bamfile).query_name
-
-            bamfile.close()
+            # Only the header and first read are read, so don't validate @SQ
+            # lines or look for an index. The context manager closes the
+            # file, and any remote connection, even if reading the first
+            # read fails.
+            with pysam.AlignmentFile(
+                self.filepath, "rb", check_sq=False, require_index=False
+            ) as bamfile:
+                # Get the header as a dictionary
+                metadata["header"] = bamfile.header.to_dict()
+
+                # Get the name of the first read
+                first_read_name = next(bamfile).query_name
 
             # Add the first read name and url to the header dictionary
             metadata["first_read_name"] = first_read_name
@@ -46,6 +49,6 @@ class BAMMetadataExtractor:
 
         except Exception as e:
             logging.error(
-                f"Failed to process BAM file at {self.filepath}. Error: {str(e)}"
+                "Failed to process BAM file at %s. Error: %s", self.filepath, e
             )
             return {"url": self.filepath, "error": str(e)}
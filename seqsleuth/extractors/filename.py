@@ -1,6 +1,16 @@
 import re
 import urllib.parse
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from seqsleuth.keywords import compile_keywords, flatten_keywords
+
+# Translation table mapping ASCII characters other than letters, digits,
+# and whitespace to a space. Non-ASCII characters are left untouched.
+_SPECIAL_CHARS_TO_SPACE = {
+    code: " "
+    for code in range(128)
+    if not (chr(code).isalnum() or chr(code).isspace())
+}
 
 
 class FilenameMetadataExtractor:
@@ -8,13 +18,22 @@ class FilenameMetadataExtractor:
     This class is used to extract metadata from a filename
     """
 
-    def __init__(self, metadata_keywords: Dict[str, Dict[str, List[str]]]):
+    def __init__(
+        self,
+        metadata_keywords: Dict[str, Dict[str, List[str]]],
+        keyword_map: Optional[Dict[str, Tuple[str, str]]] = None,
+        keyword_re: Optional[re.Pattern] = None,
+    ):
         """
         Initialize the extractor with a mapping of keywords to categories and date patterns.
 
         Args:
             metadata_keywords: A dictionary containing a mapping of keywords to categories.
-            date_patterns: A list of date pattern strings.
+            keyword_map: An optional pre-flattened keyword lookup, as exported by the
+                `seqsleuth.keywords` modules. Built from `metadata_keywords` if not given.
+            keyword_re: An optional pre-compiled pattern matching the keywords in
+                `keyword_map`, as exported by the `seqsleuth.keywords` modules.
+                Compiled from `keyword_map` if not given.
         """
         assert isinstance(
             metadata_keywords, dict
@@ -24,13 +43,22 @@ class FilenameMetadataExtractor:
                 keywords, dict
             ), f"Each category in metadata_keywords must be a dictionary. Category '{category}' is not a dictionary. {keywords}"
 
-        self.keyword_map = self.prepare_keywords(metadata_keywords)
-        self.date_patterns = [
-            r"\d{8}",  # YYYYMMDD
-            r"\d{4}-\d{2}-\d{2}",  # YYYY-MM-DD
-            r"\d{2}\d{4}",  # MMDDYYYY
-            r"\d{2}-\d{2}-\d{4}",  # MM-DD-YYYY
-        ]
+        if keyword_map is None:
+            keyword_map = flatten_keywords(metadata_keywords)
+        self.keyword_map = keyword_map
+        if keyword_re is None:
+            keyword_re = compile_keywords(keyword_map)
+        self._keyword_re = keyword_re
+        self.n_categories = len(metadata_keywords)
+        # Single alternation so each part is scanned once; longer, more
+        # specific layouts are listed first.
+        self._date_re = re.compile(
+            r"(\d{4}-\d{2}-\d{2}"  # YYYY-MM-DD
+            r"|\d{2}-\d{2}-\d{4}"  # MM-DD-YYYY
+            r"|\d{8}"  # YYYYMMDD
+            r"|\d{6})",  # MMYYYY
+            re.ASCII,
+        )
 
     @staticmethod
     def replace_special_characters_with_spaces(text: str) -> str:
@@ -43,29 +71,14 @@ class FilenameMetadataExtractor:
         Returns:
             Text with special characters replaced by spaces.
         """
-        pattern = r"[^a-zA-Z0-9\s]"
-        processed_text = re.sub(pattern, " ", text)
-        return processed_text
+        return text.translate(_SPECIAL_CHARS_TO_SPACE)
 
     @staticmethod
     def prepare_keywords(
         metadata_keywords: Dict[str, Dict[str, List[str]]]
     ) -> Dict[str, Any]:
-        """
-        Prepare a mapping of keywords to categories for quick lookup.
-
-        Args:
-            metadata_keywords: Dictionary of categories and associated keywords.
-
-        Returns:
-            A dictionary with keywords as keys and categories as values.
-        """
-        keyword_map = {}
-        for category, keywords in metadata_keywords.items():
-            for key, values in keywords.items():
-                for value in values:
-                    keyword_map[value] = (category, key)
-        return keyword_map
+        """Kept for compatibility, see `seqsleuth.keywords.flatten_keywords`."""
+        return flatten_keywords(metadata_keywords)
 
     def extract_metadata(self, filename: str) -> dict:
         """
@@ -80,31 +93,32 @@ class FilenameMetadataExtractor:
         assert isinstance(filename, str), "filename must be a string"
 
         metadata = {}
-        parsed_filename = urllib.parse.urlparse(filename).path.split("/")
-        # Extract metadata based on keywords
-        matches = []
-        for i, part in reversed(
-            list(enumerate(parsed_filename))
-        ):  # start searching from the end
-            part = part.lower()
-            if part in self.keyword_map:
-                category, key = self.keyword_map[part]
-                matches.append((i, key))  # store both position and keyword
-                if category not in metadata:  # only update if category not already set
-                    metadata[category] = matches[0][
-                        1
-                    ]  # select the keyword that appears last
+        # Only URLs need the full parser to strip the scheme, host, and query
+        if "://" in filename:
+            path = urllib.parse.urlparse(filename).path
+        else:
+            path = filename
+        parsed_filename = path.split("/")
+        parts_lower = [part.lower() for part in parsed_filename]
+        # Extract metadata based on keywords, starting from the end so the
+        # keyword that appears last wins for each category
+        for part in reversed(parts_lower):
+            for keyword in reversed(self._keyword_re.findall(part)):
+                hit = self.keyword_map.get(keyword)
+                if hit:
+                    category, key = hit
+                    metadata.setdefault(category, key)
+            if len(metadata) == self.n_categories:
+                break
 
         # Extract dates from the filename
-        for part in reversed(parsed_filename):
+        for part in reversed(parts_lower):
             if "date" in metadata:
                 break
             part = self.replace_special_characters_with_spaces(part)
-            for pattern in self.date_patterns:
-                match = re.search(pattern, part)
-                if match:
-                    metadata["date"] = match.group()
-                    break
+            match = self._date_re.search(part)
+            if match:
+                metadata["date"] = match.group(1)
 
         if not metadata:
             print("No matching metadata found in filename.")
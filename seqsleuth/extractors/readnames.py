@@ -1,18 +1,51 @@
 import logging
-from typing import List
+import concurrent.futures
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional, Type
 
 from seqsleuth.predict_tech_from_fastq import FastqFile
-from seqsleuth.extractors.seqtech import SeqTechFactory
+from seqsleuth.extractors.seqtech import SeqTech, SeqTechFactory
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many read names, process pool startup costs more than it saves
+MIN_READS_FOR_PARALLEL = 10000
+PARALLEL_CHUNKSIZE = 4096
+
+# SeqTech instance of an extraction worker process, set by _init_worker
+_worker_tech_instance: Optional[SeqTech] = None
+
+
+def _init_worker(tech_class: Type[SeqTech]) -> None:
+    """Create the SeqTech instance of an extraction worker process.
+
+    Only the class is sent to the worker, not the parent's instance and
+    the read names it holds.
+    """
+    global _worker_tech_instance
+    _worker_tech_instance = tech_class([])
+
+
+def _extract_in_worker(read_name: str) -> Dict:
+    """Extract the metadata of a validated read name in a worker process."""
+    return _worker_tech_instance.extract_metadata_from_read(read_name, validated=True)
+
 
 class ReadNameMetadataExtractor:
-    def __init__(self, fastq_file: FastqFile, filename: str, predicted_tech: str):
+    def __init__(
+        self,
+        fastq_file: FastqFile,
+        filename: str,
+        predicted_tech: str,
+        n_workers: int = 1,
+        max_reads: Optional[int] = None,
+    ):
         self.filename = filename
         self.predicted_tech = predicted_tech
+        self.n_workers = n_workers
+        # Run-level fields are constant across reads, so a sample of the
+        # read names is usually enough. None parses every read name.
+        self.max_reads = max_reads
         self.read_names = fastq_file.read_names
         self.factory = SeqTechFactory(self.predicted_tech, self.read_names)
         self.tech_instance = self.factory.create()
@@ -25,34 +58,99 @@ class ReadNameMetadataExtractor:
 
             metadata_dict = {}
 
-            # Extract metadata from all read names sequentially
-            metadata_list = self.extract_metadata_sequentially()
+            # Extract metadata from the valid unique read names, in parallel
+            # when enough of them are left to be worth a process pool
+            read_names = self.valid_read_names()
+            if self.n_workers > 1 and len(read_names) >= MIN_READS_FOR_PARALLEL:
+                read_metadata_iter = self.extract_metadata_in_parallel(read_names)
+            else:
+                read_metadata_iter = self.extract_metadata_sequentially(read_names)
 
-            for read_metadata in metadata_list:
-                if read_metadata:  # only process non-empty metadata
-                    for key, value in read_metadata.items():
-                        if key not in metadata_dict:
-                            metadata_dict[key] = set()  # create a new set for this key
-                        metadata_dict[key].add(value)  # add the new value to the set
+            # Merge each read's metadata as it is produced. A key holds its
+            # first value until a second distinct value is seen, at which
+            # point it is promoted to a set. The tech's min fields keep their
+            # smallest value instead.
+            min_fields = self.tech_instance.min_metadata_fields
+            for read_metadata in read_metadata_iter:
+                if not read_metadata:  # only process non-empty metadata
+                    continue
+                for key, value in read_metadata.items():
+                    if key not in metadata_dict:
+                        metadata_dict[key] = value
+                        continue
+                    current = metadata_dict[key]
+                    if key in min_fields:
+                        if value < current:
+                            metadata_dict[key] = value
+                    elif isinstance(current, set):
+                        current.add(value)
+                    elif current != value:
+                        metadata_dict[key] = {current, value}
 
-            # Convert sets to single values or lists, as appropriate
-            for key, value_set in metadata_dict.items():
-                if len(value_set) == 1:
-                    metadata_dict[key] = next(iter(value_set))  # single value
-                else:
-                    metadata_dict[key] = list(value_set)  # list of unique values
+            # Convert sets of multiple values to lists of unique values
+            for key, value in metadata_dict.items():
+                if isinstance(value, set):
+                    metadata_dict[key] = list(value)
 
             return metadata_dict
 
         except Exception as e:
-            logger.error(f"Exception occurred during metadata extraction: {e}")
+            logger.error("Exception occurred during metadata extraction: %s", e)
             return {}
 
-    def extract_metadata_sequentially(self):
-        metadata_list = []
-        for read_name in self.read_names:
-            metadata_list.append(
-                self.tech_instance.extract_metadata_from_read(read_name)
+    def extract_metadata_sequentially(self, read_names: List[str]):
+        """Yield the metadata of each valid unique read name, one at a time.
+
+        Args:
+            read_names: The read names returned by valid_read_names.
+        """
+        extract = self.tech_instance.extract_metadata_from_read
+        for read_name in read_names:
+            yield extract(read_name, validated=True)
+
+    def extract_metadata_in_parallel(self, read_names: List[str]):
+        """Yield the metadata of each valid unique read name, using a process pool.
+
+        Args:
+            read_names: The read names returned by valid_read_names.
+        """
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_worker,
+            initargs=(type(self.tech_instance),),
+        ) as executor:
+            yield from executor.map(
+                _extract_in_worker,
+                read_names,
+                chunksize=PARALLEL_CHUNKSIZE,
             )
 
-        return metadata_list
+    def valid_read_names(self) -> List[str]:
+        """Get the unique read names that follow the tech's read name convention.
+
+        The read names are checked in one batch before they are
+        deduplicated, so an invalid read name can't take the dedup key of
+        valid ones. Metadata extraction then doesn't need to check them
+        one at a time.
+        """
+        read_names = list(itertools.islice(self.read_names, self.max_reads))
+        matches = self.tech_instance.check_many(read_names)
+        return list(
+            self.unique_read_names(
+                read_name for read_name, match in zip(read_names, matches) if match
+            )
+        )
+
+    def unique_read_names(self, read_names: Iterable[str]) -> Iterator[str]:
+        """Yield the first read name seen for each distinct tech dedup key.
+
+        Args:
+            read_names: The read names to deduplicate.
+        """
+        dedup_key = self.tech_instance.dedup_key
+        seen = set()
+        for read_name in read_names:
+            key = dedup_key(read_name)
+            if key not in seen:
+                seen.add(key)
+                yield read_name
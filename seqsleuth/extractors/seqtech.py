@@ -1,8 +1,50 @@
 import logging
 import re
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from datetime import date
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type
+
+
+def _parse_iso_date(timestamp: str) -> date:
+    """Parses the date of a fixed-layout ISO 8601 timestamp.
+
+    Faster than datetime.strptime for timestamps like 2021-03-04T05:06:07Z.
+
+    Args:
+        timestamp: A string starting with a YYYY-MM-DD date.
+
+    Raises:
+        ValueError: If the timestamp does not start with a valid date.
+
+    Returns:
+        The date of the timestamp.
+    """
+    return date(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]))
+
+
+# Whitespace escapes outside of character classes, skipping over the classes
+_WHITESPACE_ESCAPE = re.compile(r"\[(?:\\.|[^\]])*\]|\\s")
+
+
+def _batch_pattern(source: str) -> re.Pattern:
+    """Compiles a read name pattern to match whole lines of joined read names.
+
+    The pattern is anchored at the start of each line, and whitespace
+    escapes outside of character classes no longer match newlines, so a
+    match can't run from one read name into the next.
+
+    Args:
+        source: The regular expression of a read name convention.
+
+    Returns:
+        The compiled re.MULTILINE pattern.
+    """
+    source = _WHITESPACE_ESCAPE.sub(
+        lambda match: r"[^\S\n]" if match.group() == r"\s" else match.group(),
+        source,
+    )
+    return re.compile("^" + source, re.MULTILINE)
 
 
 @dataclass
@@ -14,12 +56,20 @@ class SeqTech:
 
     Methods:
         check_read_name_convention: Checks if the read name follows the convention.
+        check_many: Checks many read names against the convention at once.
         extract_metadata_from_read: Extracts metadata from the read name.
         get_metadata_fields: Returns the metadata fields.
+        dedup_key: Returns the part of the read name the metadata depends on.
     """
 
     read_names: List[str]
     logger: Any = field(init=False, repr=False)
+    # Line-anchored (re.MULTILINE) versions of the read name patterns used by
+    # check_many, compiled from the read name source with _batch_pattern
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = ()
+    # Metadata fields reduced to their smallest value across reads, rather
+    # than collecting every distinct value
+    min_metadata_fields: ClassVar[FrozenSet[str]] = frozenset()
 
     def __post_init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -38,11 +88,58 @@ class SeqTech:
         """
         raise NotImplementedError()
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, str]:
+    def check_many(self, read_names: List[str]) -> List[bool]:
+        """Checks if many read names follow the sequencing technology convention.
+
+        The read names are joined with newlines and each of the batch patterns
+        is run over the joined text once, rather than matching every read
+        name separately. Falls back to check_read_name_convention per read
+        name when the subclass defines no batch patterns.
+
+        Args:
+            read_names: A list of read names to check.
+
+        Returns:
+            A list of booleans, one per read name, representing whether
+            each read name follows the convention.
+        """
+        if not self.batch_patterns:
+            return [self.check_read_name_convention(name) for name in read_names]
+
+        # Map the offset at which each read name starts to its index
+        line_starts = {}
+        offset = 0
+        for i, read_name in enumerate(read_names):
+            line_starts[offset] = i
+            offset += len(read_name) + 1
+
+        matches = [False] * len(read_names)
+        joined = "\n".join(read_names)
+        for pattern in self.batch_patterns:
+            for match in pattern.finditer(joined):
+                i = line_starts.get(match.start())
+                if i is not None:
+                    matches[i] = True
+
+        n_mismatched = matches.count(False)
+        if n_mismatched:
+            self.logger.error(
+                "Error: %d of %d read names do not match %s pattern.",
+                n_mismatched,
+                len(read_names),
+                self.__class__.__name__,
+            )
+        return matches
+
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Raises:
             NotImplementedError: This is a base method that should be implemented in subclasses.
@@ -63,6 +160,21 @@ class SeqTech:
         """
         raise NotImplementedError()
 
+    def dedup_key(self, read_name: str) -> str:
+        """Gets the key used to skip read names that yield identical metadata.
+
+        Read names sharing a key are only parsed once. Subclasses whose
+        metadata depends on a prefix of the read name can override this to
+        collapse reads from the same run, lane, etc.
+
+        Args:
+            read_name: A string of the read name.
+
+        Returns:
+            A string key, the full read name by default.
+        """
+        return read_name
+
 
 @dataclass
 class Illumina(SeqTech):
@@ -70,13 +182,21 @@ class Illumina(SeqTech):
 
     Args:
         read_names: A list of read names.
+        validate: Whether to check read names against the Illumina
+            convention before extracting metadata. Skip it for read names
+            that are already known to be Illumina read names.
 
     Methods are inherited from SeqTech class.
     """
 
     read_names: List[str]
-    illumina_pattern: re.Pattern = re.compile(
-        "^[\w-]+:\d+:[\w-]+:\d+:\d+:\d+:\d+\s[12]:[YN]:\d+:(\d+|[ATCGN+]+)$"
+    validate: bool = True
+    read_name_source: ClassVar[str] = (
+        r"[\w-]+:\d+:[\w-]+:\d+:\d+:\d+:\d+\s[12]:[YN]:\d+:(?:\d+|[ATCGN+]+)$"
+    )
+    illumina_pattern: ClassVar[re.Pattern] = re.compile(read_name_source)
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = (
+        _batch_pattern(read_name_source),
     )
 
     def check_read_name_convention(self, read_name: str) -> bool:
@@ -88,41 +208,95 @@ class Illumina(SeqTech):
         Returns:
             A boolean representing whether the read name follows the convention.
         """
-        match = self.illumina_pattern.match(read_name) is not None
+        # Illumina read names have exactly nine colons, rule out most other
+        # read names with that before running the full pattern
+        match = (
+            read_name.count(":") == 9
+            and self.illumina_pattern.match(read_name) is not None
+        )
         if not match:
             self.logger.error(
-                f"Error: Read name '{read_name}' does not match Illumina pattern."
+                "Error: Read name '%s' does not match Illumina pattern.", read_name
             )
         return match
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, str]:
+    def check_many(self, read_names: List[str]) -> List[bool]:
+        """Checks if many read names follow the Illumina convention.
+
+        Every read name passes when validation is turned off.
+
+        Args:
+            read_names: A list of read names to check.
+
+        Returns:
+            A list of booleans, one per read name, representing whether
+            each read name follows the convention.
+        """
+        if not self.validate:
+            return [True] * len(read_names)
+        return super().check_many(read_names)
+
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the Illumina read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Returns:
             A dictionary representing the extracted metadata.
         """
-        if not self.check_read_name_convention(read_name):
+        if (
+            self.validate
+            and not validated
+            and not self.check_read_name_convention(read_name)
+        ):
             self.logger.error(
-                "Read name convention check failed for read id: " + read_name
+                "Read name convention check failed for read id: %s", read_name
             )
             return {}
 
-        metadata = {}
-        parts = read_name.split(":")
-
-        metadata["instrument_id"] = parts[0]
-        metadata["run_number"] = int(parts[1])
-        metadata["flow_cell_id"] = parts[2]
-        metadata["flow_cell_lane"] = int(parts[3])
-
-        return metadata
+        # Only the first four fields are used, slice them out at the colon
+        # positions rather than splitting the whole read name
+        p1 = read_name.find(":")
+        p2 = read_name.find(":", p1 + 1)
+        p3 = read_name.find(":", p2 + 1)
+        p4 = read_name.find(":", p3 + 1)
+        if p4 == -1:
+            p4 = len(read_name)
+        try:
+            # Searching on from a missing colon (-1) restarts at the
+            # beginning, so too few colons shows up as out of order positions
+            if not p1 < p2 < p3 < p4:
+                raise ValueError("too few fields")
+            return {
+                "instrument_id": read_name[:p1],
+                "run_number": int(read_name[p1 + 1 : p2]),
+                "flow_cell_id": read_name[p2 + 1 : p3],
+                "flow_cell_lane": int(read_name[p3 + 1 : p4]),
+            }
+        except ValueError:
+            # Only reachable without validation
+            self.logger.error("Failed to parse Illumina read id: %s", read_name)
+            return {}
 
     def get_metadata_fields(self) -> List[str]:
         return ["instrument_id", "run_number", "flow_cell_id", "flow_cell_lane"]
 
+    def dedup_key(self, read_name: str) -> str:
+        """Gets the instrument, run, flow cell, and lane prefix of the read name.
+
+        Args:
+            read_name: A string of the read name.
+
+        Returns:
+            The first four colon-separated fields of the read name.
+        """
+        return ":".join(read_name.split(":", 4)[:4])
+
 
 @dataclass
 class PacBio(SeqTech):
@@ -135,10 +309,15 @@ class PacBio(SeqTech):
     """
 
     read_names: List[str]
-    pacbio_pattern_clr: re.Pattern = re.compile(
-        "^m\d+_\d+_\d+_c\d+_s\d+_p\d+/\d+/\d+_\d+$"
+    # CLR and CCS read names share the movie name prefix, so both conventions
+    # are alternatives of one pattern, tried with a single match call
+    read_name_source: ClassVar[str] = (
+        r"m\d+(?:_\d+_\d+_c\d+_s\d+_p\d+/\d+/\d+_\d+$|(?:\w*|U_)\d+_\d+\d+/\d+/ccs)"
+    )
+    pacbio_pattern: ClassVar[re.Pattern] = re.compile(read_name_source)
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = (
+        _batch_pattern(read_name_source),
     )
-    pacbio_pattern_ccs: re.Pattern = re.compile("m\d+(\w*|U_)\d+_\d+\d+/\d+/ccs")
 
     def check_read_name_convention(self, read_name: str) -> bool:
         """Checks if the read name follows the PacBio convention.
@@ -149,34 +328,40 @@ class PacBio(SeqTech):
         Returns:
             A boolean representing whether the read name follows the convention.
         """
+        # PacBio read names start with the movie name and contain a slash
         match = (
-            self.pacbio_pattern_clr.match(read_name) is not None
-            or self.pacbio_pattern_ccs.match(read_name) is not None
+            read_name[:1] == "m"
+            and "/" in read_name
+            and self.pacbio_pattern.match(read_name) is not None
         )
         if not match:
             self.logger.error(
-                f"Error: Read name '{read_name}' does not match PacBio pattern."
+                "Error: Read name '%s' does not match PacBio pattern.", read_name
             )
         return match
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, str]:
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the PacBio read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Returns:
             A dictionary representing the extracted metadata.
         """
-        if not self.check_read_name_convention(read_name):
+        if not validated and not self.check_read_name_convention(read_name):
             self.logger.error(
-                "Read name convention check failed for read id: " + read_name
+                "Read name convention check failed for read id: %s", read_name
             )
             return {}
 
         # Extracting metadata from PacBio read names:
         metadata = {}
-        parts = read_name.split("/")
+        parts = read_name.split("/", 2)
 
         # The first field contains the movie name
         metadata["movie_name"] = parts[0]  # .split("_")[0]
@@ -205,14 +390,32 @@ class OxfordNanopore(SeqTech):
     """
 
     read_names: List[str]
-    nanopore_pattern: re.Pattern = re.compile(
-        r"^[0-9a-f]{8}-([0-9a-f]{4}-){3}[0-9a-f]{12} runid=[0-9a-f]{40}.*$"
+    # The read UUID. Both patterns are only used with match(), so they are
+    # anchored at the start, and whatever follows the prefix is not inspected.
+    read_name_source: ClassVar[str] = r"[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12}"
+    nanopore_pattern: ClassVar[re.Pattern] = re.compile(
+        read_name_source + r" runid=[0-9a-f]{40}"
+    )
+    nanopore_pattern_non_std: ClassVar[re.Pattern] = re.compile(read_name_source)
+    # The non-standard pattern accepts anything after the UUID, so it also
+    # covers the standard one
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = (
+        _batch_pattern(read_name_source),
     )
-    nanopore_pattern_non_std: re.Pattern = re.compile(
-        r"^[0-9a-f]{8}-([0-9a-f]{4}-){3}[0-9a-f]{12}.*[a-zA-Z0-9_/:.]*$"
+    # Per-read tags, left out of the run metadata
+    skipped_tags: ClassVar[frozenset] = frozenset(("read", "ch"))
+    # Each read reports its own start date, the earliest is kept when the
+    # metadata of all reads is merged
+    min_metadata_fields: ClassVar[FrozenSet[str]] = frozenset(
+        ("earliest_start_date",)
     )
-    earliest_start_date: Optional[datetime] = None
+    # Metadata of the most recently parsed read name
     metadata: Dict[str, str] = field(default_factory=dict)
+    # Reads from the same batch share a start time, so the last one parsed
+    # is kept to skip parsing it again. Only a cache, the metadata of a read
+    # doesn't depend on the reads parsed before it.
+    _last_start_time: Optional[str] = field(default=None, init=False, repr=False)
+    _last_start_date: Optional[str] = field(default=None, init=False, repr=False)
 
     def check_read_name_convention(self, read_name: str) -> bool:
         """Checks if the read name follows the ONT convention.
@@ -223,55 +426,86 @@ class OxfordNanopore(SeqTech):
         Returns:
             A boolean representing whether the read name follows the convention.
         """
-        match = (
-            self.nanopore_pattern.match(read_name) is not None
-            or self.nanopore_pattern_non_std.match(read_name) is not None
+        return self._which_pattern(read_name) != -1
+
+    def _which_pattern(self, read_name: str) -> int:
+        """Finds which ONT pattern the read name matches, logging mismatches.
+
+        Args:
+            read_name: A string of the read name to match.
+
+        Returns:
+            0 for the standard pattern, 1 for the non-standard pattern, or -1
+            if the read name matches neither.
+        """
+        # ONT read names start with a 36 character UUID, and standard ones
+        # follow it with the run id, so check those literals first
+        if len(read_name) >= 36 and read_name[8] == "-":
+            if (
+                read_name[36:43] == " runid="
+                and self.nanopore_pattern.match(read_name) is not None
+            ):
+                return 0
+            if self.nanopore_pattern_non_std.match(read_name) is not None:
+                return 1
+        self.logger.error(
+            "Error: Read name '%s' does not match Oxford Nanopore pattern.", read_name
         )
-        if not match:
-            self.logger.error(
-                f"Error: Read name '{read_name}' does not match Oxford Nanopore pattern."
-            )
-        return match
+        return -1
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, str]:
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the Oxford Nanopore read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Returns:
             A dictionary representing the extracted metadata.
         """
-        if not self.check_read_name_convention(read_name):
+        if validated:
+            pattern = (
+                0
+                if read_name[36:43] == " runid="
+                and self.nanopore_pattern.match(read_name)
+                else 1
+            )
+        else:
+            pattern = self._which_pattern(read_name)
+        if pattern == -1:
             self.logger.error(
-                "Read name convention check failed for read id: " + read_name
+                "Read name convention check failed for read id: %s", read_name
             )
             return {}
-        if self.nanopore_pattern.match(read_name):
-            parts = read_name.split()
-            for pair in parts[1:]:
-                key, value = pair.split("=")
-                if key not in ["read", "ch"]:
-                    self.metadata[key] = value
-
-            start_time = datetime.strptime(
-                self.metadata.get("start_time", ""), "%Y-%m-%dT%H:%M:%SZ"
-            ).date()
-            if (
-                self.earliest_start_date is None
-                or start_time < self.earliest_start_date
-            ):
-                self.earliest_start_date = start_time
-
-            self.metadata["earliest_start_date"] = self.earliest_start_date.strftime(
-                "%Y-%m-%d"
-            )
-            self.metadata.pop("start_time", None)
+        metadata = {}
+        if pattern == 0:
+            skipped_tags = self.skipped_tags
+            for pair in read_name.split()[1:]:
+                key, sep, value = pair.partition("=")
+                if sep and key not in skipped_tags:
+                    metadata[key] = value
+
+            start_time_str = metadata.pop("start_time", "")
+            if start_time_str != self._last_start_time:
+                try:
+                    self._last_start_date = _parse_iso_date(
+                        start_time_str
+                    ).strftime("%Y-%m-%d")
+                except ValueError:
+                    # A malformed start time gives no start date
+                    self._last_start_date = None
+                self._last_start_time = start_time_str
+            if self._last_start_date is not None:
+                metadata["earliest_start_date"] = self._last_start_date
         else:
-            self.metadata["read_name"] = read_name
-            self.metadata["note"] = "non-standard read name"
+            metadata["read_name"] = read_name
+            metadata["note"] = "non-standard read name"
 
-        return self.metadata
+        self.metadata = metadata
+        return metadata
 
     def get_metadata_fields(self) -> List[str]:
         return list(self.metadata.keys())
@@ -288,8 +522,11 @@ class TenXGenomicsLinkedReads(SeqTech):
     """
 
     read_names: List[str]
-    linkedreads_pattern: re.Pattern = re.compile(r"^\S+:\S+:\S+:\S+:\S+:.*$")
-    metadata_values: List[Dict[str, str]] = field(default_factory=list)
+    read_name_source: ClassVar[str] = r"\S+:\S+:\S+:\S+:\S+:"
+    linkedreads_pattern: ClassVar[re.Pattern] = re.compile(read_name_source)
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = (
+        _batch_pattern(read_name_source),
+    )
 
     def check_read_name_convention(self, read_name: str) -> bool:
         """Checks if the read name follows the 10X Genomics convention.
@@ -300,25 +537,34 @@ class TenXGenomicsLinkedReads(SeqTech):
         Returns:
             A boolean representing whether the read name follows the convention.
         """
-        match = self.linkedreads_pattern.match(read_name) is not None
+        # 10X Genomics read names have at least five colons
+        match = (
+            read_name.count(":") >= 5
+            and self.linkedreads_pattern.match(read_name) is not None
+        )
         if not match:
             self.logger.error(
-                f"Error: Read name '{read_name}' does not match 10X Genomics Linked-Reads pattern."
+                "Error: Read name '%s' does not match 10X Genomics Linked-Reads pattern.",
+                read_name,
             )
         return match
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, str]:
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the 10X Genomics Linked-Reads read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Returns:
             A dictionary representing the extracted metadata.
         """
-        if not self.check_read_name_convention(read_name):
+        if not validated and not self.check_read_name_convention(read_name):
             self.logger.error(
-                "Read name convention check failed for read id: " + read_name
+                "Read name convention check failed for read id: %s", read_name
             )
             return {}
 
@@ -335,9 +581,6 @@ class TenXGenomicsLinkedReads(SeqTech):
         # The fourth field is the set identifier
         metadata["set"] = parts[3]
 
-        # Append the metadata values to the list
-        self.metadata_values.append(metadata)
-
         return metadata
 
     def get_metadata_fields(self) -> List[str]:
@@ -355,10 +598,20 @@ class DovetailSeqTech(SeqTech):
     """
 
     read_names: List[str]
-    dovetail_pattern: re.Pattern = re.compile(
-        r"^(\S+:\S+:\S+:\S+:\S+:\S+:\S+)\s(\d:\S:\d:\S+)$"
+    # Captures the first five colon-separated fields, the ones extracted
+    read_name_source: ClassVar[str] = (
+        r"([^:\s]+):([^:\s]+):([^:\s]+):([^:\s]+):([^:\s]+):\S+:\S+\s\d:\S:\d:\S+$"
     )
-    metadata: Dict[str, List[str]] = field(default_factory=dict)
+    dovetail_pattern: ClassVar[re.Pattern] = re.compile(read_name_source)
+    batch_patterns: ClassVar[Tuple[re.Pattern, ...]] = (
+        _batch_pattern(read_name_source),
+    )
+    # Metadata key of each captured field
+    field_names: ClassVar[Tuple[str, ...]] = tuple(
+        f"Library_Field_{i}" for i in range(1, 6)
+    )
+    # Metadata of the most recently parsed read name
+    metadata: Dict[str, str] = field(default_factory=dict)
     n_reads: int = 0
 
     def check_read_name_convention(self, read_name: str) -> bool:
@@ -370,41 +623,58 @@ class DovetailSeqTech(SeqTech):
         Returns:
             A boolean representing whether the read name follows the convention.
         """
-        match = self.dovetail_pattern.match(read_name) is not None
-        if not match:
+        return self._match(read_name) is not None
+
+    def _match(self, read_name: str) -> Optional[re.Match]:
+        """Matches the read name against the Dovetail pattern, logging mismatches.
+
+        Args:
+            read_name: A string of the read name to match.
+
+        Returns:
+            The match object, or None if the read name does not match.
+        """
+        # Dovetail read names have at least nine colons
+        match = None
+        if read_name.count(":") >= 9:
+            match = self.dovetail_pattern.match(read_name)
+        if match is None:
             self.logger.error(
-                f"Error: Read name '{read_name}' does not match Dovetail Genomics pattern."
+                "Error: Read name '%s' does not match Dovetail Genomics pattern.",
+                read_name,
             )
         return match
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, List[str]]:
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, str]:
         """Extracts metadata from the Dovetail Genomics read name.
 
         Args:
             read_name: A string of the read name.
+            validated: Whether the read name is already known to follow the
+                convention, e.g. from check_many, so the check is skipped.
 
         Returns:
             A dictionary representing the extracted metadata.
         """
-        if not self.check_read_name_convention(read_name):
+        if validated:
+            # The fields are still taken from the match groups
+            match = self.dovetail_pattern.match(read_name)
+        else:
+            match = self._match(read_name)
+        if match is None:
             self.logger.error(
-                "Read name convention check failed for read id: " + read_name
+                "Read name convention check failed for read id: %s", read_name
             )
             return {}
 
-        # Extracting metadata from Dovetail Genomics read names:
-        parts = read_name.split(" ")
+        # Extracting library and instrument info from the captured fields
+        ## 6th field is read number and unique per read, so isn't captured
+        metadata = dict(zip(self.field_names, match.groups()))
 
-        # Assuming the first field contains the library identifier and other fields
-        library_info = parts[0].split(":")
-
-        # Extracting library and instrument info
-        for i, field in enumerate(library_info[:5]):
-            ## 6th field is read number and unique per read
-            field_name = f"Library_Field_{i + 1}"
-            self.metadata[field_name] = field
-
-        return self.metadata
+        self.metadata = metadata
+        return metadata
 
     def get_metadata_fields(self) -> List[str]:
         return list(self.metadata.keys())
@@ -424,7 +694,9 @@ class OtherSeqTech(SeqTech):
         # As the convention for "Other" is not defined, returns True
         return True
 
-    def extract_metadata_from_read(self, read_name: str) -> Dict[str, Any]:
+    def extract_metadata_from_read(
+        self, read_name: str, validated: bool = False
+    ) -> Dict[str, Any]:
         # Returns the desired dictionary format as metadata
         return {"tech": "unimplemented parser", "read_names": read_name}
 
@@ -445,11 +717,6 @@ class UnknownSeqTech(SeqTech):
 
     read_names: List[str]
     tech: str = "Unknown"
-    read_name_regex: str = r".*"
-    read_name_pattern: Any = field(init=False, repr=False)
-
-    def __post_init__(self):
-        self.read_name_pattern = re.compile(self.read_name_regex)
 
     def format_reads(self):
         """Formats read names.
@@ -460,6 +727,58 @@ class UnknownSeqTech(SeqTech):
         return {"tech": self.tech, "read_names": self.read_names}
 
 
+# All read name conventions in a single pattern, one named group per
+# technology, so a read name is classified with one match call. Dovetail and
+# 10X Genomics patterns are left out: any colon-separated name, including
+# Illumina names without the comment, matches them, so they can only be
+# predicted from the file name.
+_READ_NAME_TECHS = {
+    "Illumina": "Illumina",
+    "PacBio": "PacBio",
+    "OxfordNanopore": "OxfordNanopore",
+}
+_READ_NAME_CLASSIFIER = re.compile(
+    "|".join(
+        f"(?P<{group}>{seqtech_class.read_name_source})"
+        for group, seqtech_class in (
+            ("Illumina", Illumina),
+            ("PacBio", PacBio),
+            ("OxfordNanopore", OxfordNanopore),
+        )
+    )
+)
+
+
+def classify_read_names(read_names: List[str]) -> List[str]:
+    """Classifies read names by the sequencing technology convention they follow.
+
+    Args:
+        read_names: A list of read names.
+
+    Returns:
+        A list with the technology name for each read name, "Unknown" for
+        read names that follow none of the conventions.
+    """
+    classify = _READ_NAME_CLASSIFIER.match
+    techs = []
+    for read_name in read_names:
+        match = classify(read_name)
+        techs.append(_READ_NAME_TECHS[match.lastgroup] if match else "Unknown")
+    return techs
+
+
+# SeqTech subclass for each predicted technology name
+SEQTECH_CLASSES: Dict[str, Type[SeqTech]] = {
+    "Illumina": Illumina,
+    "OxfordNanopore": OxfordNanopore,
+    "PacBio": PacBio,
+    "10XGenomics": TenXGenomicsLinkedReads,
+    "Dovetail": DovetailSeqTech,
+    "Unknown": UnknownSeqTech,
+    "Other": OtherSeqTech,
+}
+
+
 class SeqTechFactory:
     """Factory class for creating SeqTech class instances.
 
@@ -470,6 +789,7 @@ class SeqTechFactory:
 
     Method:
         create: Creates an instance of a SeqTech subclass based on the predicted technology.
+        predict_tech_from_read_names: Predicts the technology from the read names.
     """
 
     def __init__(
@@ -480,28 +800,44 @@ class SeqTechFactory:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging_level)
 
-        self.seqtech_classes: Dict[str, Type[SeqTech]] = {
-            "Illumina": Illumina,
-            "OxfordNanopore": OxfordNanopore,
-            "PacBio": PacBio,
-            "10XGenomics": TenXGenomicsLinkedReads,
-            "Dovetail": DovetailSeqTech,
-            "Unknown": UnknownSeqTech,
-            "Other": OtherSeqTech,
-        }
+        self.seqtech_classes = SEQTECH_CLASSES
 
     def create(self) -> SeqTech:
         """Creates an instance of a SeqTech subclass based on the predicted technology.
 
+        If the technology could not be predicted upstream, it is predicted
+        from the read names instead.
+
         Returns:
             An instance of a SeqTech subclass.
         """
-        seqtech_class = self.seqtech_classes.get(self.predicted_tech, OtherSeqTech)
+        predicted_tech = self.predicted_tech
+        if predicted_tech == "Unknown" and self.read_names:
+            predicted_tech = self.predict_tech_from_read_names()
+        seqtech_class = self.seqtech_classes.get(predicted_tech, OtherSeqTech)
         try:
             instance = seqtech_class(self.read_names)
             return instance
         except Exception as e:
             self.logger.error(
-                f"An error occurred while attempting to create an instance of {seqtech_class.__name__}: {str(e)}"
+                "An error occurred while attempting to create an instance of %s: %s",
+                seqtech_class.__name__,
+                e,
             )
             return UnknownSeqTech(self.read_names)
+
+    def predict_tech_from_read_names(self) -> str:
+        """Predicts the sequencing technology from the read names.
+
+        Returns:
+            The technology followed by the most read names, or "Unknown" if
+            more read names follow no known convention, or if two
+            technologies are tied.
+        """
+        counts = Counter(classify_read_names(self.read_names)).most_common(2)
+        if not counts:
+            return "Unknown"
+        (tech, n_reads), *runner_up = counts
+        if runner_up and runner_up[0][1] == n_reads:
+            return "Unknown"
+        return tech
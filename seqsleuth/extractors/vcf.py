@@ -3,6 +3,10 @@ import os
 
 import pysam
 
+# Header record keys with one record per contig, field or filter, left out
+# of the extracted header metadata
+_SKIP_HEADER_KEYS = frozenset(("contig", "INFO", "FORMAT", "FILTER"))
+
 
 class VCFMetadataExtractor:
     def __init__(self, filepath):
@@ -24,13 +28,13 @@ class VCFMetadataExtractor:
 
                 # Iterate over the header lines
                 for record in vcffile.header.records:
-                    if record.key not in ["contig", "INFO", "FORMAT", "FILTER"]:
+                    if record.key not in _SKIP_HEADER_KEYS:
                         header_dict[record.key] = record.value
 
                 return {"url": self.filepath, "header": header_dict}
         except Exception as e:
             logging.error(
-                f"Failed to process VCF file at {self.filepath}. Error: {str(e)}"
+                "Failed to process VCF file at %s. Error: %s", self.filepath, e
             )
             return {"url": self.filepath, "header": None, "error": str(e)}
 
@@ -0,0 +1,48 @@
+import re
+from typing import Dict, List, Tuple
+
+
+def flatten_keywords(
+    metadata_keywords: Dict[str, Dict[str, List[str]]]
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Flatten nested metadata keywords into a keyword lookup table.
+
+    Keywords are lowercased so they can be compared against lowercased
+    filename parts.
+
+    Args:
+        metadata_keywords: Dictionary of categories and associated keywords.
+
+    Returns:
+        A dictionary with lowercased keywords as keys and
+        (category, key) tuples as values.
+    """
+    return {
+        value.lower(): (category, key)
+        for category, keywords in metadata_keywords.items()
+        for key, values in keywords.items()
+        for value in values
+    }
+
+
+def compile_keywords(keyword_map: Dict[str, Tuple[str, str]]) -> re.Pattern:
+    """
+    Compile the keywords into a single pattern matching any of them.
+
+    Keywords match anywhere in a filename part as long as they are not
+    directly adjacent to another letter or digit, so `hg002` is found in
+    `hg002_run1` but not in `hg0021`. Longer keywords are tried first.
+
+    Args:
+        keyword_map: Dictionary with lowercased keywords as keys.
+
+    Returns:
+        A compiled regular expression.
+    """
+    keywords = sorted(keyword_map, key=len, reverse=True)
+    return re.compile(
+        r"(?<![a-z0-9])(?:"
+        + "|".join(re.escape(keyword) for keyword in keywords)
+        + r")(?![a-z0-9])"
+    )
@@ -0,0 +1,15 @@
+from seqsleuth.keywords import flatten_keywords
+from seqsleuth.keywords._seqtech import seqtech
+from seqsleuth.keywords._centers import centers
+from seqsleuth.keywords._samps import sample_ids, trios
+
+## Metadata keyword categories shared by all file types
+base_keywords = {
+    "sequencing_technology": seqtech,
+    "center": centers,
+    "trio": trios,
+    "sample_id": sample_ids,
+}
+
+## Flattened lookup of the shared keywords, built once for all file types
+base_keyword_map = flatten_keywords(base_keywords)
@@ -1,13 +1,8 @@
-from seqsleuth.keywords._seqtech import seqtech
-from seqsleuth.keywords._centers import centers
-from seqsleuth.keywords._samps import sample_ids, trios
+from seqsleuth.keywords import compile_keywords, flatten_keywords
+from seqsleuth.keywords._common import base_keyword_map, base_keywords
 
-## Define dictionary of metadata keywords and their corresponding categories
-metadata_keywords = {
-    "sequencing_technology": seqtech,
-    "center": centers,
-    "trio": trios,
-    "sample_id": sample_ids,
+## BAM specific metadata keywords and their corresponding categories
+bam_keywords = {
     "ref_genome": {
         "GRCh38": ["grch38", "hg38"],
         "GRCh37": ["grch37", "hs37d5", "hg19"],
@@ -22,3 +17,12 @@ metadata_keywords = {
         "pbmm2": ["pbmm2"],
     },
 }
+
+## All metadata keywords for BAM files
+metadata_keywords = {**base_keywords, **bam_keywords}
+
+## Flattened lookup of lowercased keywords to (category, key)
+keyword_map = {**base_keyword_map, **flatten_keywords(bam_keywords)}
+
+## Pattern matching any of the keywords, compiled once at import
+keyword_re = compile_keywords(keyword_map)
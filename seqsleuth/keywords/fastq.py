@@ -1,11 +1,11 @@
-from seqsleuth.keywords._seqtech import seqtech
-from seqsleuth.keywords._centers import centers
-from seqsleuth.keywords._samps import sample_ids, trios
+from seqsleuth.keywords import compile_keywords
+from seqsleuth.keywords._common import base_keyword_map, base_keywords
 
-## Define dictionary of metadata keywords and their corresponding categories
-metadata_keywords = {
-    "sequencing_technology": seqtech,
-    "center": centers,
-    "trio": trios,
-    "sample_id": sample_ids,
-}
+## FASTQ files only use the shared metadata keywords
+metadata_keywords = {**base_keywords}
+
+## Flattened lookup of lowercased keywords to (category, key)
+keyword_map = base_keyword_map
+
+## Pattern matching any of the keywords, compiled once at import
+keyword_re = compile_keywords(keyword_map)
@@ -1,20 +1,27 @@
 import argparse
 import concurrent.futures
+import contextlib
 import csv
+import itertools
 import json
 import logging
 import os
 import sys
 from multiprocessing import cpu_count
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple
 
-from seqsleuth.extractors.bam import BAMFile, BAMMetadataExtractor
+from seqsleuth.extractors.bam import BAMFile
 from seqsleuth.extractors.filename import FilenameMetadataExtractor
 from seqsleuth.extractors.readnames import ReadNameMetadataExtractor
-from seqsleuth.extractors.vcf import VCFFile, VCFMetadataExtractor
+from seqsleuth.extractors.vcf import VCFFile
+from seqsleuth.keywords.bam import keyword_map as bam_keyword_map
+from seqsleuth.keywords.bam import keyword_re as bam_keyword_re
 from seqsleuth.keywords.bam import metadata_keywords as bam_keys
+from seqsleuth.keywords.fastq import keyword_map as fastq_keyword_map
+from seqsleuth.keywords.fastq import keyword_re as fastq_keyword_re
 from seqsleuth.keywords.fastq import metadata_keywords as fastq_keys
+from seqsleuth.keywords.vcf import keyword_map as vcf_keyword_map
+from seqsleuth.keywords.vcf import keyword_re as vcf_keyword_re
 from seqsleuth.keywords.vcf import metadata_keywords as vcf_keys
 from seqsleuth.predict_tech_from_fastq import (
     FastqFile,
@@ -22,8 +29,27 @@ from seqsleuth.predict_tech_from_fastq import (
     predict_sequencing_tech,
 )
 from seqsleuth import version
+from seqsleuth.utils import valid_file
 from tqdm import tqdm
 
+# File types whose metadata comes from remote header reads. These are IO
+# bound, and htslib releases the GIL while it waits on the network, so
+# they are processed with threads rather than processes.
+THREADED_FILE_TYPES = {"bam", "vcf"}
+
+# Number of completed rows to collect before writing them to the CSV file
+WRITE_BATCH_SIZE = 1024
+# Buffer size of the output CSV files, so batches reach the disk in few writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Filename extractors keep no per-file state, so one per file type is built
+# at import and shared by every file
+FILENAME_EXTRACTORS = {
+    "fastq": FilenameMetadataExtractor(fastq_keys, fastq_keyword_map, fastq_keyword_re),
+    "bam": FilenameMetadataExtractor(bam_keys, bam_keyword_map, bam_keyword_re),
+    "vcf": FilenameMetadataExtractor(vcf_keys, vcf_keyword_map, vcf_keyword_re),
+}
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] - %(message)s",
@@ -31,43 +57,51 @@ logging.basicConfig(
 )
 
 
-def process_file(file_type: str, filename: str, num_reads: int) -> Dict[str, Any]:
-    logging.debug(f"Processing file: {filename} in process id: {os.getpid()}")
+def file_url(info: Dict[str, str]) -> str:
+    """Build the url of a file list entry, on the NIH hosted GIAB ftp site."""
+    return (
+        f"https://ftp-trace.ncbi.nlm.nih.gov"
+        f"/ReferenceSamples/giab/"
+        f"{info['filepath'].replace('/giab/ftp/', '')}/"
+        f"{info['filename']}"
+    )
+
+
+def process_file(
+    file_type: str, filename: str, num_reads: int
+) -> Optional[Tuple[str, str]]:
+    logging.debug("Processing file: %s in process id: %d", filename, os.getpid())
     try:
         if file_type == "fastq":
-            reader = FastqRecordReader(filename, num_reads)
-            records = list(reader.read_records())
-            file = FastqFile(records, filename)
+            # Only the read names are kept, so the records needn't persist
+            reader = FastqRecordReader(filename, num_reads, persist=False)
+            file = FastqFile(reader.read_records(), filename)
             predicted_tech = predict_sequencing_tech(filename)
             extractor = ReadNameMetadataExtractor(file, filename, predicted_tech)
             metadata = extractor.extract_metadata()
-            metadata_keywords = fastq_keys
         elif file_type == "bam":
             file = BAMFile(filename)
             metadata = file.metadata()
-            metadata_keywords = bam_keys
         elif file_type == "vcf":
             file = VCFFile(filename)
             metadata = file.metadata()
-            metadata_keywords = vcf_keys
 
-        filename_extractor = FilenameMetadataExtractor(metadata_keywords)
-        filename_metadata = filename_extractor.extract_metadata(filename)
+        filename_metadata = FILENAME_EXTRACTORS[file_type].extract_metadata(filename)
         metadata.update(filename_metadata)
 
-        return {"filename": filename, "metadata": json.dumps(metadata)}
+        return filename, json.dumps(metadata, separators=(",", ":"))
 
     except Exception as e:
         logging.error(
-            f"Error processing file in `process_file`: {filename}. Error message: {str(e)}"
+            "Error processing file in `process_file`: %s. Error message: %s",
+            filename,
+            e,
         )
 
 
 def main(args: argparse.Namespace) -> None:
-    file_info = []
-    reader = csv.DictReader(args.file_list)
-    for row in reader:
-        file_info.append(row)
+    with open(args.file_list, newline="") as file_list:
+        file_info = list(csv.DictReader(file_list))
 
     # Set up output directory
     output_dir = args.output_dir
@@ -81,44 +115,73 @@ def main(args: argparse.Namespace) -> None:
     else:
         logging.getLogger().setLevel(logging.INFO)
 
-    # Process files based on file type
-    for file_type in ["fastq", "bam", "vcf"]:
-        file_info_of_type = [
-            info for info in file_info if info["filetype"].lower() == file_type
-        ]
-        if file_info_of_type:
-            with open(
-                os.path.join(output_dir, f"{file_type}_metadata.csv"),
-                "w",
-                newline="",
-            ) as csvfile:
-                fieldnames = ["filename", "metadata"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                pbar = tqdm(total=len(file_info_of_type), disable=not args.progress)
-
-                with concurrent.futures.ProcessPoolExecutor(
-                    max_workers=args.workers
-                ) as executor:
-                    futures = [
-                        executor.submit(
-                            process_file,
-                            file_type,
-                            (
-                                f"https://ftp-trace.ncbi.nlm.nih.gov"
-                                f"/ReferenceSamples/giab/"
-                                f"{info['filepath'].replace('/giab/ftp/', '')}/"
-                                f"{info['filename']}"
-                            ),
-                            args.num_reads,
-                        )
-                        for info in file_info_of_type
-                    ]
-
-                    for future in concurrent.futures.as_completed(futures):
-                        writer.writerow(future.result())
-                        pbar.update(1)
-                pbar.close()
+    # Group the files by type in a single pass over the file list
+    file_info_by_type = {"fastq": [], "bam": [], "vcf": []}
+    for info in file_info:
+        file_info_of_type = file_info_by_type.get(info["filetype"].lower())
+        if file_info_of_type is not None:
+            file_info_of_type.append(info)
+    pbar = tqdm(
+        total=sum(map(len, file_info_by_type.values())), disable=not args.progress
+    )
+    with contextlib.ExitStack() as stack:
+        # Start the files of every type before collecting any results, so
+        # FASTQ processes and BAM/VCF threads run at the same time. Each
+        # kind of pool is created once and shared by its file types.
+        executors = {}
+        pending = []
+        for file_type, file_info_of_type in file_info_by_type.items():
+            if not file_info_of_type:
+                continue
+
+            csvfile = stack.enter_context(
+                open(
+                    os.path.join(output_dir, f"{file_type}_metadata.csv"),
+                    "w",
+                    newline="",
+                    buffering=OUTPUT_BUFFER_SIZE,
+                )
+            )
+            writer = csv.writer(csvfile)
+            writer.writerow(["filename", "metadata"])
+
+            if args.executor == "thread" or (
+                args.executor == "auto" and file_type in THREADED_FILE_TYPES
+            ):
+                executor_class = concurrent.futures.ThreadPoolExecutor
+            else:
+                executor_class = concurrent.futures.ProcessPoolExecutor
+            if executor_class not in executors:
+                executors[executor_class] = stack.enter_context(
+                    executor_class(max_workers=args.workers)
+                )
+
+            urls = [file_url(info) for info in file_info_of_type]
+            # Send files to process workers in chunks, a few per worker,
+            # to cut the per-file pickling and IPC. Threads ignore it.
+            chunksize = max(1, len(urls) // (args.workers * 4))
+
+            rows = executors[executor_class].map(
+                process_file,
+                itertools.repeat(file_type),
+                urls,
+                itertools.repeat(args.num_reads),
+                chunksize=chunksize,
+            )
+            pending.append((writer, rows))
+
+        for writer, rows in pending:
+            batch = []
+            for row in rows:
+                # Files that failed to process have been logged already
+                if row is not None:
+                    batch.append(row)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    writer.writerows(batch)
+                    batch.clear()
+                pbar.update(1)
+            writer.writerows(batch)
+    pbar.close()
 
 
 def validate_num_reads(value: str) -> int:
@@ -148,7 +211,7 @@ def create_arg_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "file_list",
-        type=argparse.FileType("r"),
+        type=valid_file,
         help="A csv file containing a the columns `filetype`, `filename`,"
         + " and `filepath`. The `filename` and `filepath` values are "
         + "combined to generate the file url, assuming the file is on the "
@@ -166,6 +229,13 @@ def create_arg_parser() -> argparse.ArgumentParser:
         default=1,
         help="Number of worker threads. Defaults to 1. Set to 'all' to use all CPU cores.",
     )
+    parser.add_argument(
+        "--executor",
+        choices=["auto", "thread", "process"],
+        default="auto",
+        help="Run workers as threads or processes. Defaults to 'auto', which uses "
+        + "threads for bam and vcf files and processes for fastq files.",
+    )
     parser.add_argument("--output_dir", type=str, default=".", help="Output directory.")
     parser.add_argument(
         "--verbose", action="store_true", help="Print detailed messages."
@@ -1,8 +1,9 @@
+import itertools
 import pysam
 import logging
-from typing import List, Generator
-
-logging.basicConfig(level=logging.INFO)
+import re
+import warnings
+from typing import Generator, Iterable, List, Optional
 
 # Define constants for technology names
 TECH_ILLUMINA = "Illumina"
@@ -33,41 +34,57 @@ TECH_IDENTIFIERS = {
     TECH_ION: ["ion_exome", "torrent"],
 }
 
+# One pattern per technology matching any of its identifiers, checked in
+# the order of TECH_IDENTIFIERS
+TECH_IDENTIFIER_PATTERNS = [
+    (tech, re.compile("|".join(re.escape(identifier) for identifier in identifiers)))
+    for tech, identifiers in TECH_IDENTIFIERS.items()
+]
+
+
 # Define the max length for short read
 MAX_LENGTH_SHORT_READ = 1000
 
 
 class FastqRecordReader:
-    def __init__(self, filename: str, num_reads: int):
+    def __init__(self, filename: str, num_reads: int, persist: bool = True):
         self.filename = filename
         self.num_reads = num_reads
+        # Without persist, pysam reuses one record for every read instead of
+        # copying each one. Only for callers done with a record before the next.
+        self.persist = persist
 
     def read_records(self) -> Generator[pysam.FastxRecord, None, None]:
         """
         Yield records one by one until num reads is reached.
         """
-        tries = 3
-        while tries > 0:
-            count = 0
+        # Only opening the file is retried, a failure while reading would
+        # otherwise yield the records already read a second time
+        with self._open_with_retry() as fh:
+            yield from itertools.islice(
+                fh, self.num_reads if self.num_reads != -1 else None
+            )
+
+    def _open_with_retry(self, tries: int = 3) -> pysam.FastxFile:
+        """
+        Open the file, retrying up to tries times.
+        """
+        for attempt in range(1, tries + 1):
             try:
-                with pysam.FastxFile(self.filename, "fastq") as fh:
-                    for record in fh:
-                        yield record
-                        count += 1
-                        if self.num_reads != -1 and count >= self.num_reads:
-                            break
-                break
+                # FastxFile detects the format itself, its second argument
+                # is persist
+                return pysam.FastxFile(self.filename, persist=self.persist)
             except Exception as e:
-                tries -= 1
-                if tries > 0:
+                if attempt < tries:
                     logging.error(
-                        f"Error reading file, retrying... ({3 - tries} attempts left)"
+                        "Error reading file, retrying... (%d attempts left)",
+                        tries - attempt,
                     )
                 else:
                     logging.error(
-                        f"Error reading file, no attempts left. Exception: {e}"
+                        "Error reading file, no attempts left. Exception: %s", e
                     )
-                    raise e
+                    raise
 
 
 class TechnologyPredictor:
@@ -78,13 +95,19 @@ class TechnologyPredictor:
         """
         Determine if the technology is short read based on max read length.
         """
-        max_length = max(len(record.sequence) for record in self.records)
-        return max_length < 1000
+        # Stops at the first long read instead of measuring every record
+        return all(
+            len(record.sequence) < MAX_LENGTH_SHORT_READ for record in self.records
+        )
 
     def predict_technology_based_on_read_names(self) -> str:
         for record in self.records:
             read_name = record.name
-            if read_name.split(":")[1].isdigit():
+            # Check the second colon-separated field without splitting the
+            # whole read name
+            start = read_name.find(":") + 1
+            end = read_name.find(":", start)
+            if start and read_name[start : end if end != -1 else None].isdigit():
                 return "Illumina"
             elif read_name.startswith("m") or read_name.startswith("c"):
                 return "PacBio"
@@ -94,48 +117,56 @@ class TechnologyPredictor:
 
 
 class FastqFile:
-    def __init__(self, records: List[pysam.FastxRecord], filename: str):
-        self.records = records
+    def __init__(self, records: Iterable[pysam.FastxRecord], filename: str):
+        # Records are consumed as they are read and only their names are
+        # kept, so a generator of records is never held in memory at once
         self.filename = filename
-        self.read_names = self._get_read_names()
+        self.read_names = self._get_read_names(records)
 
-    def _get_read_names(self) -> List[str]:
-        logging.debug(f"Getting read names from {self.filename}")
-        read_names = []
-        for record in self.records:
-            if record.comment:
-                read_name = record.name + " " + record.comment
-            else:
-                read_name = record.name
-            read_names.append(read_name)
-        return read_names
+    def _get_read_names(self, records: Iterable[pysam.FastxRecord]) -> List[str]:
+        logging.debug("Getting read names from %s", self.filename)
+        return [
+            f"{record.name} {record.comment}" if record.comment else record.name
+            for record in records
+        ]
 
     def predict_technology_based_on_filename(self) -> str:
+        return self.predict_technology_from_filename(self.filename)
+
+    @staticmethod
+    def predict_technology_from_filename(filename: str) -> str:
+        """
+        Predict the technology from the identifiers in a filename alone.
+        """
         try:
-            filename_lower = self.filename.lower()
-            for tech, identifiers in TECH_IDENTIFIERS.items():
-                if any(substring in filename_lower for substring in identifiers):
+            filename_lower = filename.lower()
+            for tech, pattern in TECH_IDENTIFIER_PATTERNS:
+                if pattern.search(filename_lower):
                     return tech
             return TECH_UNKNOWN
         except Exception as e:
-            logging.error(f"Error predicting technology based on filename: {e}")
+            logging.error("Error predicting technology based on filename: %s", e)
             return TECH_UNKNOWN
 
 
-def predict_sequencing_tech(filename: str, num_reads: int = 5) -> str:
-    try:
-        reader = FastqRecordReader(filename, num_reads)
-        records = list(reader.read_records())
-        fastq_file = FastqFile(records, filename)
-    except IOError as e:
-        raise IOError(f"Error initializing FastqFile: {e}")
-
-    try:
-        tech_from_filepath = fastq_file.predict_technology_based_on_filename()
-        logging.debug(
-            f"Predicted tech from filepath: {tech_from_filepath}, for {filename}"
+def predict_sequencing_tech(filename: str, num_reads: Optional[int] = None) -> str:
+    """
+    Predict the sequencing technology from the identifiers in the filename.
+
+    The file isn't opened, the technology is only predicted from read names
+    later, by SeqTechFactory, when the filename gives none. num_reads is
+    deprecated and ignored.
+    """
+    if num_reads is not None:
+        warnings.warn(
+            "num_reads is deprecated and ignored, the technology is predicted "
+            "from the filename only",
+            DeprecationWarning,
+            stacklevel=2,
         )
-    except Exception as e:
-        return f"Error predicting technology based on filename: {e}"
-
+    # Errors are logged by the predictor, which then returns TECH_UNKNOWN
+    tech_from_filepath = FastqFile.predict_technology_from_filename(filename)
+    logging.debug(
+        "Predicted tech from filepath: %s, for %s", tech_from_filepath, filename
+    )
     return tech_from_filepath
@@ -1,5 +1,17 @@
 import pytest
-from seqsleuth.extractors.seqtech import OxfordNanopore, PacBio, DovetailSeqTech
+from seqsleuth.extractors import readnames
+from seqsleuth.extractors.readnames import ReadNameMetadataExtractor
+from seqsleuth.extractors.seqtech import (
+    DovetailSeqTech,
+    Illumina,
+    OxfordNanopore,
+    PacBio,
+    SeqTechFactory,
+    TenXGenomicsLinkedReads,
+    UnknownSeqTech,
+    classify_read_names,
+)
+from seqsleuth.predict_tech_from_fastq import FastqFile, FastqRecordReader
 
 # Mocking the read_name for testing purposes
 read_name_oxford = "..."
@@ -7,6 +19,22 @@ read_name_pacbio = "m64017_191118_150849/43322019/ccs"
 read_name_dovetail = "..."
 
 
+def make_fastq_file(tmp_path, read_names):
+    # Write the read names to a FASTQ file and read them back
+    path = tmp_path / "reads.fastq"
+    path.write_text("".join(f"@{name}\nACGT\n+\nIIII\n" for name in read_names))
+    reader = FastqRecordReader(str(path), -1)
+    return FastqFile(reader.read_records(), str(path))
+
+
+def sorted_lists(metadata):
+    # Values merged into lists have no fixed order
+    return {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in metadata.items()
+    }
+
+
 def test_oxford_nanopore_check_read_name_convention():
     oxford = OxfordNanopore()
     assert oxford.check_read_name_convention(read_name_oxford) == True
@@ -38,3 +66,262 @@ def test_dovetail_extract_metadata_from_read():
     dovetail = DovetailSeqTech()
     metadata = dovetail.extract_metadata_from_read(read_name_dovetail)
     assert isinstance(metadata, dict)
+
+
+def test_illumina_dedup_key():
+    illumina = Illumina([])
+    read_name = "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT"
+    assert illumina.dedup_key(read_name) == "A00123:8:H7KJTDSXX:2"
+
+
+def test_illumina_check_many_matches_per_read_check():
+    illumina = Illumina([])
+    read_names = [
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT",
+        "not an illumina read name",
+        "A00123:8:H7KJTDSXX:2:1101:10004:10020 2:Y:0:12",
+    ]
+    assert illumina.check_many(read_names) == [
+        illumina.check_read_name_convention(read_name) for read_name in read_names
+    ]
+
+
+def test_classify_read_names():
+    read_names = [
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT",
+        read_name_pacbio,
+        "not a known read name",
+    ]
+    assert classify_read_names(read_names) == ["Illumina", "PacBio", "Unknown"]
+
+
+def test_illumina_extract_metadata_without_validation():
+    read_name = "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT"
+    validated = Illumina([]).extract_metadata_from_read(read_name)
+    unvalidated = Illumina([], validate=False).extract_metadata_from_read(read_name)
+    assert validated == unvalidated == {
+        "instrument_id": "A00123",
+        "run_number": 8,
+        "flow_cell_id": "H7KJTDSXX",
+        "flow_cell_lane": 2,
+    }
+    assert Illumina([], validate=False).extract_metadata_from_read("A00123:8") == {}
+
+
+def test_oxford_nanopore_metadata_is_per_read():
+    oxford = OxfordNanopore([])
+    prefix = "0f2c6a54-1111-2222-3333-444455556666 runid=" + "a" * 40
+    first = oxford.extract_metadata_from_read(
+        prefix + " start_time=2021-03-04T05:06:07Z flow_cell_id=FAO12345"
+    )
+    second = oxford.extract_metadata_from_read(
+        prefix + " start_time=2021-03-01T05:06:07Z"
+    )
+    assert first["flow_cell_id"] == "FAO12345"
+    assert "flow_cell_id" not in second
+    assert second["earliest_start_date"] == "2021-03-01"
+
+
+def test_dovetail_extract_metadata_from_captured_fields():
+    dovetail = DovetailSeqTech([])
+    metadata = dovetail.extract_metadata_from_read(
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT"
+    )
+    assert metadata == {
+        "Library_Field_1": "A00123",
+        "Library_Field_2": "8",
+        "Library_Field_3": "H7KJTDSXX",
+        "Library_Field_4": "2",
+        "Library_Field_5": "1101",
+    }
+
+
+def test_dovetail_check_many_does_not_match_across_read_names():
+    dovetail = DovetailSeqTech([])
+    # Each half of a valid read name, which only match when joined by a space
+    read_names = ["A00123:8:H7KJTDSXX:2:1101:10004:10019", "1:N:0:ACGTACGT"]
+    assert dovetail.check_many(read_names) == [False, False]
+    assert dovetail.check_many([" ".join(read_names)]) == [True]
+
+
+def test_dovetail_metadata_is_per_read():
+    dovetail = DovetailSeqTech([])
+    first = dovetail.extract_metadata_from_read(
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT"
+    )
+    second = dovetail.extract_metadata_from_read(
+        "B00456:9:H7KJTDSXX:3:1101:10004:10019 1:N:0:ACGTACGT"
+    )
+    assert first is not second
+    assert first["Library_Field_1"] == "A00123"
+    assert second["Library_Field_1"] == "B00456"
+
+
+def test_10x_metadata_is_per_read():
+    tenx = TenXGenomicsLinkedReads([])
+    first = tenx.extract_metadata_from_read("S1:L1:x:SET1:y:z")
+    second = tenx.extract_metadata_from_read("S2:L1:x:SET2:y:z")
+    assert first == {"sample": "S1", "library": "L1", "set": "SET1"}
+    assert second["sample"] == "S2"
+    assert "metadata_values" not in vars(tenx)
+
+
+def test_pacbio_extract_metadata_from_validated_read():
+    pacbio = PacBio([])
+    assert pacbio.check_many([read_name_pacbio]) == [True]
+    assert pacbio.extract_metadata_from_read(
+        read_name_pacbio, validated=True
+    ) == pacbio.extract_metadata_from_read(read_name_pacbio)
+
+
+def test_oxford_nanopore_parallel_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setattr(readnames, "MIN_READS_FOR_PARALLEL", 1)
+    read_names = [
+        f"{i:08x}-1111-2222-3333-444455556666 runid={'a' * 40}"
+        f" read={i} ch=1 start_time=2021-03-{13 - i % 13:02d}T05:06:07Z"
+        f" flow_cell_id=FAO{i % 2}"
+        for i in range(40)
+    ]
+    fastq_file = make_fastq_file(tmp_path, read_names)
+    sequential = ReadNameMetadataExtractor(
+        fastq_file, "reads.fastq", "OxfordNanopore", n_workers=1
+    ).extract_metadata()
+    parallel = ReadNameMetadataExtractor(
+        fastq_file, "reads.fastq", "OxfordNanopore", n_workers=2
+    ).extract_metadata()
+    assert sequential["earliest_start_date"] == "2021-03-01"
+    assert sorted_lists(parallel) == sorted_lists(sequential)
+
+
+def test_parallel_threshold_counts_unique_valid_read_names(tmp_path, monkeypatch):
+    # Both read names share a dedup key, so only one is left to extract
+    monkeypatch.setattr(readnames, "MIN_READS_FOR_PARALLEL", 2)
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, illumina_read_names),
+        "reads.fastq",
+        "Illumina",
+        n_workers=2,
+    )
+
+    def fail(read_names):
+        raise AssertionError("used a process pool for one read name")
+
+    monkeypatch.setattr(extractor, "extract_metadata_in_parallel", fail)
+    assert extractor.extract_metadata()["flow_cell_id"] == "H7KJTDSXX"
+
+
+def test_invalid_read_name_does_not_hide_valid_reads_on_its_lane(tmp_path):
+    read_names = [
+        # Same lane prefix as the valid read names, but an invalid index
+        "A00123:8:H7KJTDSXX:2:1101:10004:10018 1:N:0:NOT-AN-INDEX",
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT",
+        "A00123:8:H7KJTDSXX:2:1101:10004:10020 1:N:0:ACGTACGT",
+    ]
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, read_names), "reads.fastq", "Illumina"
+    )
+    assert extractor.valid_read_names() == [read_names[1]]
+    assert extractor.extract_metadata() == {
+        "instrument_id": "A00123",
+        "run_number": 8,
+        "flow_cell_id": "H7KJTDSXX",
+        "flow_cell_lane": 2,
+    }
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_illumina_validate_flag_applies_to_extraction(tmp_path, validate):
+    # Parses as Illumina, but the index doesn't follow the convention
+    read_name = "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:NOT-AN-INDEX"
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, [read_name]), "reads.fastq", "Illumina"
+    )
+    extractor.tech_instance = Illumina(extractor.read_names, validate=validate)
+    metadata = extractor.extract_metadata()
+    if validate:
+        assert metadata == {}
+    else:
+        assert metadata["flow_cell_id"] == "H7KJTDSXX"
+
+
+illumina_read_names = [
+    "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT",
+    "A00123:8:H7KJTDSXX:2:1101:10004:10020 1:N:0:ACGTACGT",
+]
+pacbio_read_names = [
+    "m64017_191118_150849/43322019/ccs",
+    "m64017_191118_150849/43322020/ccs",
+]
+
+
+def test_unknown_tech_is_predicted_from_read_names(tmp_path):
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, illumina_read_names + ["not a known read name"]),
+        "reads.fastq",
+        "Unknown",
+    )
+    assert isinstance(extractor.tech_instance, Illumina)
+    assert extractor.extract_metadata()["flow_cell_id"] == "H7KJTDSXX"
+
+
+def test_predicted_tech_is_not_overridden_by_read_names():
+    factory = SeqTechFactory("PacBio", illumina_read_names)
+    assert isinstance(factory.create(), PacBio)
+
+
+def test_tied_read_name_techs_stay_unknown():
+    factory = SeqTechFactory("Unknown", illumina_read_names + pacbio_read_names)
+    assert factory.predict_tech_from_read_names() == "Unknown"
+    assert isinstance(factory.create(), UnknownSeqTech)
+
+
+def test_mostly_unclassified_read_names_stay_unknown():
+    read_names = illumina_read_names[:1] + ["read_a", "read_b"]
+    factory = SeqTechFactory("Unknown", read_names)
+    assert factory.predict_tech_from_read_names() == "Unknown"
+    assert isinstance(factory.create(), UnknownSeqTech)
+
+
+@pytest.mark.parametrize(
+    "read_name",
+    [
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019",
+        "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGT BC:Z:x",
+    ],
+)
+def test_colon_separated_read_names_are_not_10x(read_name):
+    assert classify_read_names([read_name]) == ["Unknown"]
+    factory = SeqTechFactory("Unknown", [read_name])
+    assert isinstance(factory.create(), UnknownSeqTech)
+
+
+def test_extract_metadata_keeps_single_values_scalar(tmp_path):
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, illumina_read_names), "reads.fastq", "Illumina"
+    )
+    assert extractor.extract_metadata()["flow_cell_lane"] == 2
+
+
+def test_extract_metadata_collects_distinct_values_in_a_list(tmp_path):
+    read_names = illumina_read_names + [
+        "A00123:8:H7KJTDSXX:3:1101:10004:10021 1:N:0:ACGTACGT",
+    ]
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, read_names), "reads.fastq", "Illumina"
+    )
+    metadata = extractor.extract_metadata()
+    assert sorted(metadata["flow_cell_lane"]) == [2, 3]
+    assert metadata["flow_cell_id"] == "H7KJTDSXX"
+
+
+def test_extract_metadata_only_reads_max_reads(tmp_path):
+    read_names = illumina_read_names + [
+        "A00123:8:H7KJTDSXX:3:1101:10004:10021 1:N:0:ACGTACGT",
+    ]
+    extractor = ReadNameMetadataExtractor(
+        make_fastq_file(tmp_path, read_names),
+        "reads.fastq",
+        "Illumina",
+        max_reads=2,
+    )
+    assert extractor.extract_metadata()["flow_cell_lane"] == 2
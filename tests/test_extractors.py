@@ -12,7 +12,7 @@ from seqsleuth.predict_tech_from_fastq import predict_sequencing_tech
 @pytest.fixture
 def sample_fastq_file(tmpdir):
     # Create a temporary FASTQ file for testing predict_sequencing_tech()
-    fastq_file = tmpdir.join("sample.fastq")
+    fastq_file = tmpdir.join("sample_illumina.fastq")
     fastq_file.write(
         "@read1\nAGCTCGTAGCTACGTA\n+\nHHHHHHHHHHHHHHHH\n@read2\nTCAGCTAGCTAGC\n+\nHHHHHHHHHHH"
     )
@@ -20,9 +20,15 @@ def sample_fastq_file(tmpdir):
 
 
 def test_predict_sequencing_tech(sample_fastq_file):
-    # Test predict_sequencing_tech()
+    # Test predict_sequencing_tech(), which only looks at the filename
     tech = predict_sequencing_tech(sample_fastq_file)
     assert tech == "Illumina"
+    assert predict_sequencing_tech("/data/sample.fastq") == "Unknown"
+
+
+def test_predict_sequencing_tech_num_reads_is_deprecated(sample_fastq_file):
+    with pytest.warns(DeprecationWarning):
+        assert predict_sequencing_tech(sample_fastq_file, 5) == "Illumina"
 
 
 def test_bam_metadata_extractor():
@@ -53,6 +59,43 @@ def test_filename_metadata_extractor():
     }
 
 
+def test_filename_metadata_extractor_keyword_boundaries():
+    # Keywords embedded in a longer alphanumeric run are not matches
+    metadata_keywords = {"sample_id": {"HG002": ["hg002"]}}
+    extractor = FilenameMetadataExtractor(metadata_keywords)
+    assert extractor.extract_metadata("/data/HG002_run1.fastq")["sample_id"] == "HG002"
+    assert "sample_id" not in extractor.extract_metadata("/data/HG0021.fastq")
+
+
+@pytest.mark.parametrize(
+    "filename, sample_id",
+    [
+        # The filename beats its directories
+        ("/data/HG002/HG003_reads.fastq", "HG003"),
+        # A deeper directory beats a shallower one
+        ("/data/HG002/HG003/reads.fastq", "HG003"),
+        # Within a part, the last keyword wins
+        ("/data/HG002_HG003.fastq", "HG003"),
+        ("/data/HG003_HG002.fastq", "HG002"),
+        # A sample in the filename beats conflicting samples in the directory
+        ("/release/run_NA12877_NA12878/NA12877.vcf.gz", "NA12877"),
+        # Without one in the filename, the directory's last sample is used
+        ("/release/run_NA12877_NA12878/calls.vcf.gz", "NA12878"),
+    ],
+)
+def test_filename_metadata_extractor_keyword_precedence(filename, sample_id):
+    metadata_keywords = {
+        "sample_id": {
+            "HG002": ["hg002"],
+            "HG003": ["hg003"],
+            "NA12877": ["na12877"],
+            "NA12878": ["na12878"],
+        }
+    }
+    extractor = FilenameMetadataExtractor(metadata_keywords)
+    assert extractor.extract_metadata(filename)["sample_id"] == sample_id
+
+
 def test_vcf_metadata_extractor(tmpdir):
     # Test VCFMetadataExtractor
     vcf_file = tmpdir.join("sample.vcf")
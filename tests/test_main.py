@@ -1,38 +1,77 @@
 import pytest
 import os
 import csv
+import json
 import argparse
+import pysam
 from seqsleuth import main
 
+illumina_read_names = [
+    "A00123:8:H7KJTDSXX:2:1101:10004:10019 1:N:0:ACGTACGT",
+    "A00123:8:H7KJTDSXX:2:1101:10004:10020 1:N:0:ACGTACGT",
+]
+
 
 # Define a fixture to provide a temporary file for testing
 @pytest.fixture
 def temporary_file(tmpdir):
+    fastq_file = tmpdir.join("HG002_illumina.fastq")
+    fastq_file.write(
+        "".join(f"@{name}\nACGT\n+\nIIII\n" for name in illumina_read_names)
+    )
+    header = {"HD": {"VN": "1.6"}, "SQ": [{"SN": "chr1", "LN": 100}]}
+    with pysam.AlignmentFile(str(tmpdir.join("HG002.bam")), "wb", header=header) as bam:
+        read = pysam.AlignedSegment()
+        read.query_name = "read1"
+        read.query_sequence = "ACGT"
+        read.flag = 4
+        bam.write(read)
+
     csv_data = [
         {
-            "file_type": "fastq",
-            "filename": "file1.fastq",
-            "filepath": "/path/to/file1.fastq",
+            "filetype": "fastq",
+            "filename": "HG002_illumina.fastq",
+            "filepath": str(tmpdir),
         },
-        {"file_type": "bam", "filename": "file2.bam", "filepath": "/path/to/file2.bam"},
+        # Doesn't exist, so fails to process and gets no row
+        {"filetype": "fastq", "filename": "missing.fastq", "filepath": str(tmpdir)},
+        {"filetype": "bam", "filename": "HG002.bam", "filepath": str(tmpdir)},
     ]
 
     csv_file = tmpdir.join("test.csv")
     with open(csv_file, "w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=["file_type", "filename", "filepath"])
+        writer = csv.DictWriter(file, fieldnames=["filetype", "filename", "filepath"])
         writer.writeheader()
         writer.writerows(csv_data)
 
     return str(csv_file)
 
 
-def test_main_function(temporary_file):
+@pytest.fixture
+def local_files(monkeypatch):
+    # Read the listed files from disk instead of the GIAB ftp site
+    monkeypatch.setattr(
+        main, "file_url", lambda info: os.path.join(info["filepath"], info["filename"])
+    )
+
+
+def read_rows(output_dir, file_type):
+    with open(os.path.join(output_dir, f"{file_type}_metadata.csv"), newline="") as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.parametrize("executor", ["auto", "thread", "process"])
+def test_main_function(temporary_file, local_files, monkeypatch, executor):
+    # Write every row as its own batch
+    monkeypatch.setattr(main, "WRITE_BATCH_SIZE", 1)
+    output_dir = os.path.dirname(temporary_file)
     # Set up command-line arguments
     args = argparse.Namespace(
         file_list=temporary_file,
         num_reads=5,
-        workers=1,
-        output_dir=os.path.dirname(temporary_file),
+        workers=2,
+        executor=executor,
+        output_dir=output_dir,
         verbose=False,
         progress=False,
     )
@@ -40,7 +79,35 @@ def test_main_function(temporary_file):
     # Run the main function
     main.main(args)
 
-    # TODO: Add assertions to check the output files and their contents
+    header, *fastq_rows = read_rows(output_dir, "fastq")
+    assert header == ["filename", "metadata"]
+    assert [row[0] for row in fastq_rows] == [
+        os.path.join(output_dir, "HG002_illumina.fastq")
+    ]
+    fastq_metadata = json.loads(fastq_rows[0][1])
+    assert fastq_metadata["flow_cell_id"] == "H7KJTDSXX"
+    assert fastq_metadata["sample_id"] == "HG002"
+
+    header, *bam_rows = read_rows(output_dir, "bam")
+    assert header == ["filename", "metadata"]
+    assert len(bam_rows) == 1
+    bam_metadata = json.loads(bam_rows[0][1])
+    assert bam_metadata["metadata"]["first_read_name"] == "read1"
+
+    # No vcf files are listed, so no vcf output is written
+    assert not os.path.exists(os.path.join(output_dir, "vcf_metadata.csv"))
+
+
+def test_process_file_returns_filename_and_json(temporary_file):
+    filename = os.path.join(os.path.dirname(temporary_file), "HG002_illumina.fastq")
+    result = main.process_file("fastq", filename, 5)
+    assert isinstance(result, tuple)
+    assert result[0] == filename
+    assert json.loads(result[1])["instrument_id"] == "A00123"
+
+
+def test_process_file_returns_none_on_error(tmpdir):
+    assert main.process_file("fastq", str(tmpdir.join("missing.fastq")), 5) is None
 
 
 # Add more tests as needed